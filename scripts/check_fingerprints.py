@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+from diff_runs import diff_runs, read_fingerprints, resolve_fingerprints
+from fingerprint import fingerprint_google, fingerprint_result, fingerprint_solr, fingerprints_path, write_fingerprints
+
+# Smoke checks for fingerprinting and run diffing. Run with: python scripts/check_fingerprints.py
+
+SOLR = [{"entryId": "1", "score": 10.0}, {"entryId": "2", "score": 9.5}, {"entryId": "3", "score": 7.0}]
+GOOGLE = {"places": [{"id": "a"}, {"id": "b"}]}
+
+
+def entry(key, result):
+    return dict(key=key, query=key, **fingerprint_result(result))
+
+
+def write_jsonl(path, records):
+    with open(path, "w", encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def check_diff_statuses():
+    old = [entry("a", SOLR), entry("b", SOLR), entry("c", SOLR), entry("d", SOLR), entry("e", GOOGLE)]
+    new = [
+        entry("b", SOLR),                                            # unchanged
+        entry("c", SOLR[::-1]),                                      # reordered
+        entry("d", SOLR[:2] + [{"entryId": "9", "score": 7.0}]),     # different hits
+        entry("e", {"places": GOOGLE["places"][::-1]}),              # reordered
+        entry("f", SOLR),                                            # new query
+    ]
+    got = [(status, e["key"]) for status, e in diff_runs(iter(old), iter(new))]
+    assert got == [("removed", "a"), ("reranked", "c"), ("changed", "d"), ("reranked", "e"), ("added", "f")], got
+    assert list(diff_runs(iter([]), iter([]))) == []
+
+
+def check_rescored_is_reranked():
+    rescored = [dict(SOLR[0], score=8.0)] + SOLR[1:]
+    assert fingerprint_solr(rescored)["fingerprint"] != fingerprint_solr(SOLR)["fingerprint"]
+    assert fingerprint_solr(rescored)["members"] == fingerprint_solr(SOLR)["members"]
+
+
+def check_malformed_payloads():
+    fingerprint_solr([{"entryId": "1", "score": "3.2"}, "x", None, {"entryId": "2", "score": "n/a"}])
+    fingerprint_google({"places": ["x", {"id": "a"}]})
+    fingerprint_google({"places": None})
+    assert fingerprint_solr([{"entryId": "1", "score": "3.2"}]) == fingerprint_solr([{"entryId": "1", "score": 3.2}])
+
+
+def check_backfill_matches_fetch_time(tmp):
+    payloads = [
+        (fingerprint_solr, SOLR), (fingerprint_solr, []), (fingerprint_solr, {}),
+        (fingerprint_solr, {"message": "err"}), (fingerprint_google, GOOGLE), (fingerprint_google, {}),
+    ]
+    for i, (fingerprint_fn, result) in enumerate(payloads):
+        fetched = os.path.join(tmp, f"fetched_{i}.jsonl")
+        legacy = os.path.join(tmp, f"legacy_{i}.jsonl")
+        write_jsonl(fetched, [{"query": "q", "result": result, **fingerprint_fn(result)}])
+        write_jsonl(legacy, [{"query": "q", "result": result}])
+        a = list(read_fingerprints(write_fingerprints(fetched)))
+        b = list(read_fingerprints(write_fingerprints(legacy)))
+        assert a == b, (result, a, b)
+
+
+def check_duplicates_and_order(tmp):
+    results = os.path.join(tmp, "dupes.jsonl")
+    write_jsonl(results, [{"query": "z", "result": SOLR}, {"query": "a", "result": []}, {"query": "z", "result": []}])
+    entries = list(read_fingerprints(write_fingerprints(results)))
+    assert [e["query"] for e in entries] == ["a", "z"]
+    assert entries[1]["fingerprint"] == fingerprint_solr([])["fingerprint"]
+
+    unsorted = os.path.join(tmp, "unsorted_fingerprints.jsonl")
+    write_jsonl(unsorted, [entry('"b"', SOLR), entry('"a"', SOLR)])
+    try:
+        list(read_fingerprints(unsorted))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("out-of-order fingerprint file was accepted")
+
+
+def check_stale_sidecar_is_rebuilt(tmp):
+    results = os.path.join(tmp, "stale.jsonl")
+    write_jsonl(results, [{"query": "q", "result": SOLR}])
+    sidecar = write_fingerprints(results)
+    write_jsonl(results, [{"query": "q", "result": []}])
+    os.utime(sidecar, (0, 0))
+    assert resolve_fingerprints(results) == fingerprints_path(results)
+    assert list(read_fingerprints(sidecar))[0]["fingerprint"] == fingerprint_solr([])["fingerprint"]
+    # A sidecar path resolves through its results file as well
+    os.utime(sidecar, (0, 0))
+    resolve_fingerprints(sidecar)
+    assert os.path.getmtime(sidecar) > 0
+
+
+def main():
+    check_diff_statuses()
+    check_rescored_is_reranked()
+    check_malformed_payloads()
+    with tempfile.TemporaryDirectory() as tmp:
+        check_backfill_matches_fetch_time(tmp)
+        check_duplicates_and_order(tmp)
+        check_stale_sidecar_is_rebuilt(tmp)
+    print("All fingerprint checks passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import json
+import logging
+import os
+from fingerprint import fingerprints_path, is_fingerprints_file, results_path, write_fingerprints
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Diff two runs by their per-query result fingerprints.")
+    parser.add_argument('old', help='Results file (or its _fingerprints.jsonl) of the earlier run')
+    parser.add_argument('new', help='Results file (or its _fingerprints.jsonl) of the later run')
+    parser.add_argument('--output', help='Where to write the changed queries (default: stdout)')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild both fingerprint files from the results first')
+    return parser.parse_args()
+
+
+def resolve_fingerprints(path, rebuild=False):
+    """
+    Returns the fingerprint file for a run, (re)building it when it is missing,
+    older than its results file (an interrupted or edited run) or when asked to.
+    """
+    if is_fingerprints_file(path):
+        sidecar, path = path, results_path(path)
+        if not os.path.exists(path):
+            if rebuild:
+                logging.warning(f"No results file for '{sidecar}', cannot rebuild it.")
+            return sidecar
+    else:
+        sidecar = fingerprints_path(path)
+
+    if rebuild:
+        logging.info(f"Rebuilding fingerprint file for '{path}'.")
+    elif not os.path.exists(sidecar):
+        logging.info(f"No fingerprint file for '{path}', building one.")
+    elif os.path.getmtime(sidecar) < os.path.getmtime(path):
+        logging.warning(f"Fingerprint file for '{path}' is older than the results, rebuilding it.")
+    else:
+        return sidecar
+    return write_fingerprints(path)
+
+
+def read_fingerprints(path):
+    """Yields fingerprint entries, checking they are in the key order a merge-join relies on."""
+    previous = None
+    with open(path, "r", encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if previous is not None and entry["key"] <= previous:
+                raise ValueError(f"'{path}' is not sorted by query key; rebuild it with fingerprint.py")
+            previous = entry["key"]
+            yield entry
+
+
+def diff_runs(old_entries, new_entries):
+    """
+    Merge-joins two key-sorted fingerprint streams in a single pass.
+
+    Yields:
+        (status, entry) for each query that differs, where status is one of
+        'added', 'removed', 'reranked' (same hits, different order or scores)
+        or 'changed' (different hits).
+    """
+    old = next(old_entries, None)
+    new = next(new_entries, None)
+    while old is not None or new is not None:
+        if new is None or (old is not None and old["key"] < new["key"]):
+            yield "removed", old
+            old = next(old_entries, None)
+        elif old is None or new["key"] < old["key"]:
+            yield "added", new
+            new = next(new_entries, None)
+        else:
+            if old["fingerprint"] != new["fingerprint"]:
+                yield ("reranked" if old["members"] == new["members"] else "changed"), new
+            old = next(old_entries, None)
+            new = next(new_entries, None)
+
+
+def main():
+    args = parse_args()
+    old_file = resolve_fingerprints(args.old, args.rebuild)
+    new_file = resolve_fingerprints(args.new, args.rebuild)
+
+    counts = {"added": 0, "removed": 0, "reranked": 0, "changed": 0}
+    out_file = open(args.output, "w", encoding='utf-8') if args.output else None
+    try:
+        for status, entry in diff_runs(read_fingerprints(old_file), read_fingerprints(new_file)):
+            counts[status] += 1
+            line = json.dumps({"query": entry["query"], "status": status}, ensure_ascii=False)
+            if out_file:
+                out_file.write(line + "\n")
+            else:
+                print(line)
+    finally:
+        if out_file:
+            out_file.close()
+
+    summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+    logging.info(f"Diff of '{old_file}' -> '{new_file}': {summary}.")
+
+
+if __name__ == "__main__":
+    main()
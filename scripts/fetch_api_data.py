@@ -3,6 +3,7 @@ import requests
 import time
 import logging
 import os
+from fingerprint import fingerprint_solr, safe_fingerprint, write_fingerprints
 
 # --- Configuration ---
 START_INDEX = 0
@@ -67,13 +68,14 @@ def main():
 
             if result is not None:
                 # Store the query along with the result for easy comparison later
-                out_file.write(json.dumps({"query": query, "result": result}) + "\n")
+                out_file.write(json.dumps({"query": query, "result": result, **safe_fingerprint(fingerprint_solr, result)}) + "\n")
             else:
                 fail_file.write(json.dumps({"query": query, "error": error}) + "\n")
 
             if i % 50 == 0 or i == total_items:
                 logging.info(f"Processed {i} / {total_items} items")
 
+    write_fingerprints(OUTPUT_FILE)
     logging.info(f"Processing complete. Results in '{OUTPUT_FILE}', failures in '{FAILED_FILE}'.")
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ import time
 import logging
 import argparse
 import os
+from fingerprint import fingerprint_solr, safe_fingerprint, write_fingerprints
 
 # --- Configuration ---
 API_URL = "http://172.16.201.69:8086/solr/getGisDataUsingFuzzySearch"
@@ -100,7 +101,7 @@ def main():
             }
             result, error = fetch_with_retries(params)
             if result is not None:
-                out_file.write(json.dumps({"query": item, "result": result}) + "\n")
+                out_file.write(json.dumps({"query": item, "result": result, **safe_fingerprint(fingerprint_solr, result)}) + "\n")
             else:
                 fail_file.write(json.dumps({"query": item, "error": error}) + "\n")
             if i % 50 == 0 or i == total_items:
@@ -108,6 +109,7 @@ def main():
         if not_found:
             for keyword in not_found:
                 fail_file.write(json.dumps({"query": keyword, "error": "Keyword not found in CSV"}) + "\n")
+    write_fingerprints(results_file)
     logging.info(f"Processing complete. Results in '{results_file}', failures in '{failed_file}'.")
 
 if __name__ == "__main__":
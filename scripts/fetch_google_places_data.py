@@ -4,6 +4,7 @@ import time
 import os
 from dotenv import load_dotenv
 import logging
+from fingerprint import fingerprint_google, safe_fingerprint, write_fingerprints
 
 # --- Configuration ---
 # Set up basic logging to provide clear feedback during execution
@@ -106,13 +107,14 @@ def main():
 
             if result is not None:
                 # Include the original query for better traceability
-                out_file.write(json.dumps({"query": query, "result": result}) + "\n")
+                out_file.write(json.dumps({"query": query, "result": result, **safe_fingerprint(fingerprint_google, result)}) + "\n")
             else:
                 fail_file.write(json.dumps({"query": query, "error": error}) + "\n")
 
             if i % 50 == 0 or i == total_items:
                 logging.info(f"Processed {i} / {total_items} items")
 
+    write_fingerprints(OUTPUT_FILE)
     logging.info(f"Processing complete. Results in '{OUTPUT_FILE}', failures in '{FAILED_FILE}'.")
 
 
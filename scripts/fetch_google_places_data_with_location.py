@@ -6,6 +6,7 @@ import os
 import logging
 import argparse
 from dotenv import load_dotenv
+from fingerprint import fingerprint_google, safe_fingerprint, write_fingerprints
 
 # --- Configuration ---
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -149,7 +150,7 @@ def main():
                 continue
             result, error = fetch_places_with_retries(session, item['keyword'], item['lat'], item['lng'])
             if result is not None:
-                out_file.write(json.dumps({"query": item, "result": result}) + "\n")
+                out_file.write(json.dumps({"query": item, "result": result, **safe_fingerprint(fingerprint_google, result)}) + "\n")
             else:
                 fail_file.write(json.dumps({"query": item, "error": error}) + "\n")
             if i % 50 == 0 or i == total_items:
@@ -157,6 +158,7 @@ def main():
         if not_found:
             for keyword in not_found:
                 fail_file.write(json.dumps({"query": keyword, "error": "Keyword not found in CSV"}) + "\n")
+    write_fingerprints(results_file)
     logging.info(f"Processing complete. Results in '{results_file}', failures in '{failed_file}'.")
 
 if __name__ == "__main__":
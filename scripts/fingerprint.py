@@ -0,0 +1,144 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+
+# --- Configuration ---
+TOP_K = 10  # number of Solr scores folded into the fingerprint
+FINGERPRINTS_SUFFIX = "_fingerprints.jsonl"
+# --- End Configuration ---
+
+
+def _digest(parts):
+    return hashlib.sha1("\x1f".join(parts).encode('utf-8')).hexdigest()
+
+
+def query_key(query):
+    """Returns a stable string key for a query (a plain string or a keyword/lat/lng dict)."""
+    return json.dumps(query, sort_keys=True, ensure_ascii=False)
+
+
+def _hits(hits):
+    # Skip anything that is not a hit object rather than failing the whole run on it
+    if not isinstance(hits, list):
+        return []
+    return [hit for hit in hits if isinstance(hit, dict)]
+
+
+def _score(hit):
+    try:
+        return f"{float(hit.get('score') or 0.0):.6g}"
+    except (TypeError, ValueError):
+        return str(hit.get('score'))
+
+
+def solr_hit_ids(result):
+    return [str(hit.get('entryId')) for hit in _hits(result)]
+
+
+def google_hit_ids(result):
+    if not isinstance(result, dict):
+        return []
+    return [str(place.get('id')) for place in _hits(result.get('places'))]
+
+
+def fingerprint_solr(result):
+    """
+    Fingerprints an ordered Solr hit list by its entryId sequence and top-k scores.
+
+    Returns:
+        A dict with `fingerprint`, which changes whenever the order, the hits or
+        the top-k scores change, and `members`, which only changes when the set
+        of hits changes so a diff can tell reranks apart.
+    """
+    ids = solr_hit_ids(result)
+    if not ids:
+        # Empty and error payloads hash like an empty Google result, so backfilled
+        # fingerprints match the ones written at fetch time
+        return {"fingerprint": _digest([]), "members": _digest([])}
+    scores = [_score(hit) for hit in _hits(result)[:TOP_K]]
+    return {"fingerprint": _digest(ids + ['|'] + scores), "members": _digest(sorted(ids))}
+
+
+def fingerprint_google(result):
+    """Fingerprints an ordered Google Places hit list by its place ids."""
+    ids = google_hit_ids(result)
+    return {"fingerprint": _digest(ids), "members": _digest(sorted(ids))}
+
+
+def fingerprint_result(result):
+    """Picks the fingerprint for a stored result by its shape (Solr returns a list, Google a dict)."""
+    if isinstance(result, list):
+        return fingerprint_solr(result)
+    return fingerprint_google(result)
+
+
+def safe_fingerprint(fingerprint_fn, result):
+    """
+    Fingerprints a result for storing on its line inside a fetch loop. Never
+    raises: on failure the fields are left out and the fingerprint is rebuilt
+    from the payload by write_fingerprints.
+    """
+    try:
+        return fingerprint_fn(result)
+    except Exception as e:
+        logging.warning(f"Could not fingerprint result: {e}")
+        return {}
+
+
+def is_fingerprints_file(path):
+    return path.endswith(FINGERPRINTS_SUFFIX)
+
+
+def fingerprints_path(results_file):
+    return os.path.splitext(results_file)[0] + FINGERPRINTS_SUFFIX
+
+
+def results_path(fingerprints_file):
+    return fingerprints_file[:-len(FINGERPRINTS_SUFFIX)] + ".jsonl"
+
+
+def write_fingerprints(results_file):
+    """
+    Writes the fingerprint file for a results file, sorted by query key so two
+    runs can be merge-joined in one pass. Fingerprints stored on the result
+    lines are reused; older runs without them are fingerprinted from the payload.
+    Later lines for the same query win, matching append-mode reruns.
+    """
+    entries = {}
+    with open(results_file, "r", encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                query = record["query"]
+            except (json.JSONDecodeError, KeyError) as e:
+                logging.error(f"Skipping invalid line in '{results_file}': {e}")
+                continue
+            if "fingerprint" in record and "members" in record:
+                fp = {"fingerprint": record["fingerprint"], "members": record["members"]}
+            else:
+                fp = fingerprint_result(record.get("result"))
+            entries[query_key(query)] = dict(query=query, **fp)
+
+    output_file = fingerprints_path(results_file)
+    with open(output_file, "w", encoding='utf-8') as out_file:
+        for key in sorted(entries):
+            out_file.write(json.dumps(dict(key=key, **entries[key]), ensure_ascii=False) + "\n")
+    logging.info(f"Wrote {len(entries)} fingerprints to '{output_file}'.")
+    return output_file
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if len(sys.argv) < 2:
+        print(f"Usage: python {os.path.basename(__file__)} RESULTS_FILE [RESULTS_FILE ...]")
+        sys.exit(1)
+    for path in sys.argv[1:]:
+        if is_fingerprints_file(path):
+            logging.warning(f"'{path}' is already a fingerprint file, skipping.")
+            continue
+        write_fingerprints(path)